@@ -1,29 +1,41 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.components import webhook
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, CONF_WEBHOOK_ID
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import aiohttp_client, device_registry as dr
+from homeassistant.helpers import aiohttp_client, config_validation as cv, device_registry as dr
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
-from .api import JamfNowAuthError, JamfNowClient
+from .api import JamfNowAuthError, JamfNowClient, JamfNowDevice
+from .bulk import BULK_ACTIONS, OS_VERSION_PATTERN, async_run_bulk_action, filter_devices, has_filter
 from .const import (
     CONF_BASE_URL,
     DEFAULT_BASE_URL,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_PROFILE_TOP,
     DOMAIN,
+    EVENT_BULK_ACTION_RESULT,
+    GET_CACHE_TTL_SECONDS,
     PLATFORMS,
+    SERVICE_BULK_ACTION,
     SERVICE_ENABLE_LOST_MODE,
     SERVICE_DISABLE_LOST_MODE,
+    SERVICE_PROFILE_REFRESH,
     SERVICE_RESTART_DEVICE,
     SERVICE_SET_BLUEPRINT,
     SERVICE_SHUTDOWN_DEVICE,
     SERVICE_SYNC_INVENTORY,
 )
 from .coordinator import JamfNowDataUpdateCoordinator
+from .profiling import async_profile_refreshes
+from .webhook import async_register_webhook, async_unregister_webhook
 
 JamfNowConfigEntry = ConfigEntry
 
@@ -40,6 +52,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: JamfNowConfigEntry) -> b
         base_url=entry.data.get(CONF_BASE_URL, DEFAULT_BASE_URL),
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
+        cache_ttl=GET_CACHE_TTL_SECONDS,
     )
 
     await client.async_login()
@@ -55,6 +68,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: JamfNowConfigEntry) -> b
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    new_webhook = CONF_WEBHOOK_ID not in entry.data
+    if new_webhook:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()}
+        )
+    async_register_webhook(hass, entry.data[CONF_WEBHOOK_ID], coordinator, notify=new_webhook)
+
     if not hass.data[DOMAIN].get("services_registered"):
         _register_services(hass)
         hass.data[DOMAIN]["services_registered"] = True
@@ -63,9 +83,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: JamfNowConfigEntry) -> b
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: JamfNowConfigEntry) -> bool:
+    async_unregister_webhook(hass, entry.data[CONF_WEBHOOK_ID])
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if data:
+            await data["coordinator"].async_shutdown()
     return unload_ok
 
 
@@ -187,6 +210,51 @@ def _register_services(hass: HomeAssistant) -> None:
         await client.async_sync_inventory(jamf_device_id)
         await coordinator.async_request_refresh()
 
+    async def handle_profile_refresh(call: ServiceCall) -> None:
+        coordinators: list[JamfNowDataUpdateCoordinator] = [
+            data["coordinator"]
+            for entry_id, data in hass.data.get(DOMAIN, {}).items()
+            if entry_id != "services_registered"
+        ]
+        await async_profile_refreshes(hass, coordinators, call.data["top"])
+
+    async def handle_bulk_action(call: ServiceCall) -> None:
+        action: str = call.data["action"]
+        if action == SERVICE_SET_BLUEPRINT and not call.data.get("target_blueprint_id"):
+            raise ValueError("target_blueprint_id is required for set_blueprint")
+        if not has_filter(call.data) and not call.data["all_devices"]:
+            raise ValueError("Set at least one filter, or all_devices to target every Jamf Now device")
+        now = dt_util.utcnow()
+        targets: list[tuple[JamfNowClient, JamfNowDevice]] = []
+        coordinators: list[JamfNowDataUpdateCoordinator] = []
+        for entry_id, data in hass.data.get(DOMAIN, {}).items():
+            if entry_id == "services_registered":
+                continue
+            coordinator: JamfNowDataUpdateCoordinator = data["coordinator"]
+            if not coordinator.data:
+                continue
+            matches = filter_devices(coordinator.data, call.data, now)
+            if matches:
+                coordinators.append(coordinator)
+                targets.extend((data["client"], device) for device in matches)
+
+        event_data: dict[str, Any] = {
+            "action": action,
+            "dry_run": call.data["dry_run"],
+            "matched": len(targets),
+        }
+        if call.data["dry_run"]:
+            event_data["devices"] = [{"device_id": device.id, "name": device.name} for _, device in targets]
+            hass.bus.async_fire(EVENT_BULK_ACTION_RESULT, event_data)
+            return
+
+        results = await async_run_bulk_action(targets, action, call.data, call.data["max_concurrency"])
+        await asyncio.gather(*(coordinator.async_request_refresh() for coordinator in coordinators))
+        event_data["succeeded"] = sum(1 for result in results if result["success"])
+        event_data["failed"] = len(results) - event_data["succeeded"]
+        event_data["results"] = results
+        hass.bus.async_fire(EVENT_BULK_ACTION_RESULT, event_data)
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_BLUEPRINT,
@@ -236,3 +304,40 @@ def _register_services(hass: HomeAssistant) -> None:
         handle_sync_inventory,
         vol.Schema({vol.Required("device_id"): [str]}),
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        handle_profile_refresh,
+        vol.Schema(
+            {
+                vol.Optional("top", default=DEFAULT_PROFILE_TOP): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+            }
+        ),
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_ACTION,
+        handle_bulk_action,
+        vol.Schema(
+            {
+                vol.Required("action"): vol.In(BULK_ACTIONS),
+                vol.Optional("target_blueprint_id"): str,
+                vol.Optional("message"): str,
+                vol.Optional("phone"): str,
+                vol.Optional("blueprint"): str,
+                vol.Optional("model"): str,
+                vol.Optional("os_version_at_least"): vol.All(str, vol.Match(OS_VERSION_PATTERN)),
+                vol.Optional("os_version_below"): vol.All(str, vol.Match(OS_VERSION_PATTERN)),
+                vol.Optional("status"): str,
+                vol.Optional("supervised"): bool,
+                vol.Optional("not_checked_in_for"): cv.positive_time_period,
+                vol.Optional("all_devices", default=False): bool,
+                vol.Optional("dry_run", default=False): bool,
+                vol.Optional("max_concurrency", default=DEFAULT_BULK_CONCURRENCY): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=50)
+                ),
+            }
+        ),
+    )
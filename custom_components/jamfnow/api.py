@@ -1,11 +1,20 @@
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 import asyncio
+from collections import deque
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+import json
+import re
+import time
+from typing import Any, ContextManager, Deque, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlsplit
 
 import aiohttp
+from multidict import CIMultiDict
 
 
 class JamfNowError(Exception):
@@ -41,16 +50,220 @@ class JamfNowDevice:
     last_check_in: str | None
     lost_mode: str | None
     supervised: bool | None = None
+    last_check_in_at: datetime | None = None
 
 
-class JamfNowClient:
+class JamfNowPhaseRecorder:
+
+    def __init__(self) -> None:
+        self.phases: list[tuple[str, float, float]] = []
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start - self._origin, time.perf_counter() - start))
+
+
+@dataclass
+class JamfNowResponse:
 
-    def __init__(self, session: aiohttp.ClientSession, base_url: str, username: str, password: str) -> None:
+    status: int
+    headers: CIMultiDict[str]
+    body: str
+    elapsed: float = 0.0
+
+
+class JamfNowTransport(ABC):
+
+    @abstractmethod
+    async def async_request(self, method: str, url: str, **kwargs: Any) -> JamfNowResponse:
+        ...
+
+
+class JamfNowAiohttpTransport(JamfNowTransport):
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
         self._session = session
+
+    async def async_request(self, method: str, url: str, **kwargs: Any) -> JamfNowResponse:
+        start = time.perf_counter()
+        async with self._session.request(method, url, **kwargs) as resp:
+            body = await resp.text()
+            return JamfNowResponse(
+                status=resp.status,
+                headers=CIMultiDict(resp.headers),
+                body=body,
+                elapsed=time.perf_counter() - start,
+            )
+
+
+SCRUBBED = "REDACTED"
+DEFAULT_SCRUB_HEADERS = ("Set-Cookie", "Cookie", "Authorization")
+DEFAULT_SCRUB_FIELDS = ("username", "password", "email", "phoneNumber", "token")
+
+
+class JamfNowRecordingTransport(JamfNowTransport):
+
+    def __init__(
+        self,
+        inner: JamfNowTransport,
+        scrub_headers: Iterable[str] = DEFAULT_SCRUB_HEADERS,
+        scrub_fields: Iterable[str] = DEFAULT_SCRUB_FIELDS,
+    ) -> None:
+        self._inner = inner
+        self._scrub_headers = {header.lower() for header in scrub_headers}
+        self._scrub_fields = set(scrub_fields)
+        self.interactions: list[dict[str, Any]] = []
+
+    async def async_request(self, method: str, url: str, **kwargs: Any) -> JamfNowResponse:
+        response = await self._inner.async_request(method, url, **kwargs)
+        self.interactions.append(
+            {
+                "method": method,
+                "path": _cassette_path(url),
+                "status": response.status,
+                "headers": [
+                    [key, value]
+                    for key, value in response.headers.items()
+                    if key.lower() not in self._scrub_headers
+                ],
+                "body": self._scrub_body(response.body, response.headers.get("Content-Type", "")),
+                "elapsed": response.elapsed,
+            }
+        )
+        return response
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as cassette:
+            json.dump({"interactions": self.interactions}, cassette)
+
+    def _scrub_body(self, body: str, content_type: str) -> str:
+        if not self._scrub_fields or "application/json" not in content_type or not body.strip():
+            return body
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return body
+        return json.dumps(self._scrub_value(data))
+
+    def _scrub_value(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: SCRUBBED if key in self._scrub_fields and item is not None else self._scrub_value(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [self._scrub_value(item) for item in value]
+        return value
+
+
+class JamfNowReplayTransport(JamfNowTransport):
+
+    def __init__(self, interactions: list[dict[str, Any]], speed: float = 1.0) -> None:
+        self._speed = speed
+        self._queues: dict[tuple[str, str], Deque[dict[str, Any]]] = {}
+        for interaction in interactions:
+            key = (interaction["method"], interaction["path"])
+            self._queues.setdefault(key, deque()).append(interaction)
+
+    @classmethod
+    def load(cls, path: str, speed: float = 1.0) -> JamfNowReplayTransport:
+        with open(path, encoding="utf-8") as cassette:
+            return cls(json.load(cassette)["interactions"], speed=speed)
+
+    async def async_request(self, method: str, url: str, **kwargs: Any) -> JamfNowResponse:
+        queue = self._queues.get((method, _cassette_path(url)))
+        if not queue:
+            raise JamfNowApiError(f"No recorded response for {method} {_cassette_path(url)}")
+        interaction = queue[0]
+        if len(queue) > 1:
+            queue.popleft()
+        if self._speed > 0 and interaction["elapsed"] > 0:
+            await asyncio.sleep(interaction["elapsed"] / self._speed)
+        return JamfNowResponse(
+            status=interaction["status"],
+            headers=CIMultiDict([(key, value) for key, value in interaction["headers"]]),
+            body=interaction["body"],
+            elapsed=interaction["elapsed"],
+        )
+
+
+DEVICE_LISTING_PATH = "/device-status/devices"
+BLUEPRINTS_PATH = "/frontend/rest/blueprints"
+DEVICE_PATH = "/frontend/rest/devices/{device_id}"
+_DEVICE_ID_IN_PATH = re.compile(r"/devices/([^/]+)")
+_BLUEPRINT_ID_IN_PATH = re.compile(r"/blueprints/([^/]+)")
+
+
+def endpoint_template(path: str) -> str:
+    path = _DEVICE_ID_IN_PATH.sub("/devices/{device_id}", path)
+    return _BLUEPRINT_ID_IN_PATH.sub("/blueprints/{blueprint_id}", path)
+
+
+def parse_timestamp(value: Any) -> datetime | None:
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        if not value.isdigit():
+            try:
+                parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+            except ValueError:
+                return None
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    if seconds > 1e11:
+        seconds /= 1000
+    try:
+        return datetime.fromtimestamp(seconds, tz=timezone.utc)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def _cassette_path(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+class JamfNowClient:
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | None,
+        base_url: str,
+        username: str,
+        password: str,
+        transport: JamfNowTransport | None = None,
+        cache_ttl: float = 0.0,
+    ) -> None:
+        if transport is None:
+            if session is None:
+                raise ValueError("Either a session or a transport is required")
+            transport = JamfNowAiohttpTransport(session)
+        self._transport = transport
         self._base_url = base_url.rstrip("/")
         self._username = username
         self._password = password
         self._logged_in = False
+        self.phase_recorder: JamfNowPhaseRecorder | None = None
+        self._cache_ttl = cache_ttl
+        self._get_cache: dict[str, tuple[float, Any]] = {}
+        self._inflight_gets: dict[str, asyncio.Future[Any]] = {}
+        self._mutations = 0
+
+    def phase(self, name: str) -> ContextManager[None]:
+        if self.phase_recorder is None:
+            return nullcontext()
+        return self.phase_recorder.phase(name)
 
     async def _ensure_login(self) -> None:
         if self._logged_in:
@@ -58,25 +271,80 @@ class JamfNowClient:
         await self.async_login()
 
     async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        if method != "GET":
+            self._invalidate(path, kwargs.get("json"))
+            return await self._send(method, path, **kwargs)
+        if kwargs:
+            return await self._send(method, path, **kwargs)
+
+        cached = self._get_cache.get(path)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                return cached[1]
+            del self._get_cache[path]
+        inflight = self._inflight_gets.get(path)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._send(method, path))
+            self._inflight_gets[path] = inflight
+            mutations = self._mutations
+            inflight.add_done_callback(lambda future: self._store_get(path, future, mutations))
+        return await asyncio.shield(inflight)
+
+    def _store_get(self, path: str, future: asyncio.Future[Any], mutations: int) -> None:
+        if self._inflight_gets.get(path) is future:
+            del self._inflight_gets[path]
+        if future.cancelled() or future.exception() is not None:
+            return
+        if self._cache_ttl > 0 and mutations == self._mutations:
+            now = time.monotonic()
+            # Every entry shares the same TTL, so insertion order is expiry order.
+            expired: list[str] = []
+            for key, (expires, _) in self._get_cache.items():
+                if expires > now:
+                    break
+                expired.append(key)
+            for key in expired:
+                del self._get_cache[key]
+            self._get_cache.pop(path, None)
+            self._get_cache[path] = (now + self._cache_ttl, future.result())
+
+    def clear_cache(self) -> None:
+        self._get_cache.clear()
+
+    def _invalidate(self, path: str, payload: Any) -> None:
+        self._mutations += 1
+        stale = {DEVICE_LISTING_PATH}
+        device_ids = set(_DEVICE_ID_IN_PATH.findall(path))
+        if isinstance(payload, dict):
+            device_ids.update(str(device_id) for device_id in payload.get("deviceIds") or [])
+        stale.update(DEVICE_PATH.format(device_id=device_id) for device_id in device_ids)
+        if path.startswith(BLUEPRINTS_PATH):
+            stale.add(BLUEPRINTS_PATH)
+        for key in stale:
+            self._get_cache.pop(key, None)
+            self._inflight_gets.pop(key, None)
+
+    async def _send(self, method: str, path: str, **kwargs: Any) -> Any:
         url = f"{self._base_url}{path}"
         for attempt in range(2):
             if not self._logged_in:
                 await self._ensure_login()
             try:
-                async with self._session.request(method, url, **kwargs) as resp:
-                    if resp.status == 401:
-                        if attempt == 0:
-                            self._logged_in = False
-                            continue
-                        raise JamfNowAuthError("Invalid credentials for Jamf Now")
-                    if resp.status >= 400:
-                        text = await resp.text()
-                        raise JamfNowApiError(f"Jamf Now API error {resp.status}: {text}")
-                    if "application/json" in resp.headers.get("Content-Type", ""):
-                        return await resp.json()
-                    return await resp.text()
+                with self.phase(f"{method} {endpoint_template(path)}"):
+                    resp = await self._transport.async_request(method, url, **kwargs)
             except aiohttp.ClientError as err:
                 raise JamfNowApiError(f"Connection error: {err}") from err
+            if resp.status == 401:
+                if attempt == 0:
+                    self._logged_in = False
+                    continue
+                raise JamfNowAuthError("Invalid credentials for Jamf Now")
+            if resp.status >= 400:
+                raise JamfNowApiError(f"Jamf Now API error {resp.status}: {resp.body}")
+            if "application/json" in resp.headers.get("Content-Type", ""):
+                with self.phase(f"decode {endpoint_template(path)}"):
+                    return json.loads(resp.body) if resp.body.strip() else None
+            return resp.body
         raise JamfNowAuthError("Authentication failed after retry")
 
     async def async_login(self) -> None:
@@ -88,22 +356,21 @@ class JamfNowClient:
         }
 
         try:
-            async with self._session.post(login_url, data=payload) as resp:
-                if resp.status == 401:
-                    raise JamfNowAuthError("Invalid credentials for Jamf Now")
-                if resp.status >= 400:
-                    text = await resp.text()
-                    raise JamfNowApiError(f"Login failed {resp.status}: {text}")
-
-                if not resp.headers.get("x-ajax-location"):
-                    raise JamfNowAuthError("Login failed: no redirect provided")
-
-                self._logged_in = True
+            resp = await self._transport.async_request("POST", login_url, data=payload)
         except aiohttp.ClientError as err:
             raise JamfNowApiError(f"Connection error during login: {err}") from err
+        if resp.status == 401:
+            raise JamfNowAuthError("Invalid credentials for Jamf Now")
+        if resp.status >= 400:
+            raise JamfNowApiError(f"Login failed {resp.status}: {resp.body}")
+
+        if not resp.headers.get("x-ajax-location"):
+            raise JamfNowAuthError("Login failed: no redirect provided")
+
+        self._logged_in = True
 
     async def async_get_blueprints(self) -> list[JamfNowBlueprint]:
-        data = await self._request("GET", "/frontend/rest/blueprints")
+        data = await self._request("GET", BLUEPRINTS_PATH)
         blueprints: list[JamfNowBlueprint] = []
         for item in data if isinstance(data, list) else data.get("blueprints", []):
             blueprints.append(
@@ -116,7 +383,33 @@ class JamfNowClient:
         return blueprints
 
     async def async_get_devices(self) -> list[JamfNowDevice]:
-        data = await self._request("GET", "/device-status/devices")
+        devices = await self.async_get_device_listing()
+        with self.phase("device details"):
+            results = await asyncio.gather(
+                *(self.async_get_device(device.id) for device in devices),
+                return_exceptions=True,
+            )
+        for device, detail in zip(devices, results):
+            if isinstance(detail, Exception):
+                continue
+            self.apply_device_detail(device, detail)
+        return devices
+
+    async def async_get_device_listing(self) -> list[JamfNowDevice]:
+        data = await self._request("GET", DEVICE_LISTING_PATH)
+        with self.phase("normalize devices"):
+            return self._parse_devices(data)
+
+    @staticmethod
+    def apply_device_detail(device: JamfNowDevice, detail: Dict[str, Any]) -> None:
+        lost_info = (detail.get("status") or {}).get("lostModeInfo") or {}
+        status = lost_info.get("status")
+        if status:
+            device.lost_mode = status
+        device.supervised = detail.get("supervised", device.supervised)
+
+    @staticmethod
+    def _parse_devices(data: Any) -> list[JamfNowDevice]:
         devices: list[JamfNowDevice] = []
         for item in data if isinstance(data, list) else data.get("devices", []):
             blueprint = item.get("blueprint") or {}
@@ -152,22 +445,11 @@ class JamfNowClient:
                     supervised=item.get("supervised"),
                 )
             )
-        results = await asyncio.gather(
-            *(self.async_get_device(device.id) for device in devices),
-            return_exceptions=True,
-        )
-        for device, detail in zip(devices, results):
-            if isinstance(detail, Exception):
-                continue
-            lost_info = (detail.get("status") or {}).get("lostModeInfo") or {}
-            status = lost_info.get("status")
-            if status:
-                device.lost_mode = status
-            device.supervised = detail.get("supervised", device.supervised)
+            devices[-1].last_check_in_at = parse_timestamp(devices[-1].last_check_in)
         return devices
 
     async def async_get_device(self, device_id: str) -> Dict[str, Any]:
-        data = await self._request("GET", f"/frontend/rest/devices/{device_id}")
+        data = await self._request("GET", DEVICE_PATH.format(device_id=device_id))
         if isinstance(data, dict):
             return data
         raise JamfNowApiError("Unexpected device response structure")
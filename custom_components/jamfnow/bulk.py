@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import re
+from typing import Any
+
+from .api import JamfNowClient, JamfNowDevice
+from .const import (
+    SERVICE_DISABLE_LOST_MODE,
+    SERVICE_ENABLE_LOST_MODE,
+    SERVICE_RESTART_DEVICE,
+    SERVICE_SET_BLUEPRINT,
+    SERVICE_SHUTDOWN_DEVICE,
+    SERVICE_SYNC_INVENTORY,
+)
+from .coordinator import JamfNowData
+
+BULK_ACTIONS = (
+    SERVICE_RESTART_DEVICE,
+    SERVICE_SHUTDOWN_DEVICE,
+    SERVICE_SYNC_INVENTORY,
+    SERVICE_ENABLE_LOST_MODE,
+    SERVICE_DISABLE_LOST_MODE,
+    SERVICE_SET_BLUEPRINT,
+)
+
+BULK_FILTERS = (
+    "blueprint",
+    "model",
+    "os_version_at_least",
+    "os_version_below",
+    "status",
+    "supervised",
+    "not_checked_in_for",
+)
+OS_VERSION_PATTERN = r"^\d+(\.\d+)*$"
+
+
+def has_filter(filters: dict[str, Any]) -> bool:
+    return any(filters.get(key) not in (None, "") for key in BULK_FILTERS)
+
+
+def _version_tuple(version: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
+
+def filter_devices(data: JamfNowData, filters: dict[str, Any], now: datetime) -> list[JamfNowDevice]:
+    blueprint = filters.get("blueprint")
+    blueprint_ids: set[str] = set()
+    if blueprint:
+        blueprint_ids = {
+            str(bp.id)
+            for bp in data.blueprints
+            if str(bp.id) == blueprint or bp.name.casefold() == blueprint.casefold()
+        }
+    model: str | None = filters.get("model")
+    at_least = _version_tuple(filters["os_version_at_least"]) if filters.get("os_version_at_least") else None
+    below = _version_tuple(filters["os_version_below"]) if filters.get("os_version_below") else None
+    status: str | None = filters.get("status")
+    supervised: bool | None = filters.get("supervised")
+    not_checked_in_for: timedelta | None = filters.get("not_checked_in_for")
+
+    matches: list[JamfNowDevice] = []
+    for device in data.devices:
+        if blueprint and str(device.blueprint_id) not in blueprint_ids:
+            continue
+        if model and (not device.model or model.casefold() not in device.model.casefold()):
+            continue
+        if at_least is not None or below is not None:
+            if not device.os_version:
+                continue
+            version = _version_tuple(device.os_version)
+            if at_least is not None and version < at_least:
+                continue
+            if below is not None and version >= below:
+                continue
+        if status and (device.status or "").casefold() != status.casefold():
+            continue
+        if supervised is not None and device.supervised is not supervised:
+            continue
+        if not_checked_in_for is not None:
+            if device.last_check_in_at is not None and device.last_check_in_at > now - not_checked_in_for:
+                continue
+        matches.append(device)
+    return matches
+
+
+async def async_run_bulk_action(
+    targets: list[tuple[JamfNowClient, JamfNowDevice]],
+    action: str,
+    options: dict[str, Any],
+    max_concurrency: int,
+) -> list[dict[str, Any]]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(client: JamfNowClient, device: JamfNowDevice) -> dict[str, Any]:
+        result: dict[str, Any] = {"device_id": device.id, "name": device.name, "success": False}
+        if action in (SERVICE_ENABLE_LOST_MODE, SERVICE_DISABLE_LOST_MODE) and device.supervised is False:
+            result["error"] = "Lost Mode is only available for supervised devices"
+            return result
+        async with semaphore:
+            try:
+                await _async_call(client, device.id, action, options)
+            except Exception as err:  # reported per device in the result event
+                result["error"] = str(err)
+                return result
+        result["success"] = True
+        return result
+
+    return await asyncio.gather(*(_run(client, device) for client, device in targets))
+
+
+async def _async_call(client: JamfNowClient, device_id: str, action: str, options: dict[str, Any]) -> None:
+    if action == SERVICE_RESTART_DEVICE:
+        await client.async_restart_device(device_id)
+    elif action == SERVICE_SHUTDOWN_DEVICE:
+        await client.async_shutdown_device(device_id)
+    elif action == SERVICE_SYNC_INVENTORY:
+        await client.async_sync_inventory(device_id)
+    elif action == SERVICE_ENABLE_LOST_MODE:
+        await client.async_enable_lost_mode(
+            device_id,
+            message=options.get("message") or "Lost mode enabled via Home Assistant",
+            phone=options.get("phone") or "",
+        )
+    elif action == SERVICE_DISABLE_LOST_MODE:
+        await client.async_disable_lost_mode(device_id)
+    elif action == SERVICE_SET_BLUEPRINT:
+        await client.async_set_blueprint(device_id, options["target_blueprint_id"])
+    else:
+        raise ValueError(f"Unsupported bulk action {action}")
@@ -85,14 +85,7 @@ class JamfNowActionButton(ButtonEntity):
 
     @property
     def device_info(self) -> DeviceInfo:
-        device = self.coordinator.get_device(self._device_id)
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.name if device else "Jamf Now Device",
-            manufacturer="Apple",
-            model=device.model if device else None,
-            serial_number=device.serial_number if device else None,
-        )
+        return self.coordinator.device_info(self._device_id)
 
     async def async_press(self) -> None:
         if self._action_key in {"lost_mode", "disable_lost_mode"}:
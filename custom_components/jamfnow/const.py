@@ -7,6 +7,11 @@ CONF_BASE_URL = "base_url"
 
 DEFAULT_BASE_URL = "https://services-api.services.jamfnow.com"
 UPDATE_INTERVAL_SECONDS = 300
+WEBHOOK_RECONCILE_INTERVAL_SECONDS = 3600
+WEBHOOK_IDLE_SECONDS = 900
+DETAIL_BACKFILL_BATCH_SIZE = 25
+GET_CACHE_TTL_SECONDS = 10
+STALE_AFTER_DAYS = 7
 
 SERVICE_SET_BLUEPRINT = "set_blueprint"
 SERVICE_ENABLE_LOST_MODE = "enable_lost_mode"
@@ -14,3 +19,17 @@ SERVICE_DISABLE_LOST_MODE = "disable_lost_mode"
 SERVICE_RESTART_DEVICE = "restart_device"
 SERVICE_SHUTDOWN_DEVICE = "shutdown_device"
 SERVICE_SYNC_INVENTORY = "sync_inventory"
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+SERVICE_BULK_ACTION = "bulk_action"
+
+EVENT_BULK_ACTION_RESULT = "jamfnow_bulk_action_result"
+EVENT_DEVICE_STALE = "jamfnow_device_stale"
+STALE_DEVICES_CONTEXT = "stale_devices"
+DEFAULT_BULK_CONCURRENCY = 5
+
+DEFAULT_PROFILE_TOP = 30
+
+WEBHOOK_EVENT_CHECK_IN = "check_in"
+WEBHOOK_EVENT_ENROLLMENT = "enrollment"
+WEBHOOK_EVENT_LOST_MODE = "lost_mode"
+WEBHOOK_EVENT_BLUEPRINT = "blueprint"
@@ -1,13 +1,31 @@
-
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
 import logging
-from homeassistant.core import HomeAssistant
+from operator import itemgetter
+from typing import Any, Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later, async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import JamfNowBlueprint, JamfNowClient, JamfNowDevice
-from .const import DOMAIN, UPDATE_INTERVAL_SECONDS
+from homeassistant.util import dt as dt_util
+
+from .api import JamfNowBlueprint, JamfNowClient, JamfNowDevice, parse_timestamp
+from .const import (
+    DETAIL_BACKFILL_BATCH_SIZE,
+    DOMAIN,
+    EVENT_DEVICE_STALE,
+    STALE_AFTER_DAYS,
+    STALE_DEVICES_CONTEXT,
+    UPDATE_INTERVAL_SECONDS,
+    WEBHOOK_IDLE_SECONDS,
+    WEBHOOK_RECONCILE_INTERVAL_SECONDS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,6 +35,10 @@ class JamfNowData:
     def __init__(self, devices: list[JamfNowDevice], blueprints: list[JamfNowBlueprint]) -> None:
         self.devices = devices
         self.blueprints = blueprints
+        self._devices_by_id = {device.id: device for device in devices}
+
+    def get_device(self, device_id: str) -> JamfNowDevice | None:
+        return self._devices_by_id.get(device_id)
 
 
 class JamfNowDataUpdateCoordinator(DataUpdateCoordinator[JamfNowData]):
@@ -29,24 +51,255 @@ class JamfNowDataUpdateCoordinator(DataUpdateCoordinator[JamfNowData]):
             update_interval=timedelta(seconds=UPDATE_INTERVAL_SECONDS),
         )
         self.client = client
+        self._details_loaded = False
+        self._backfill_task: asyncio.Task[None] | None = None
+        self._device_infos: dict[str, DeviceInfo] = {}
+        self._registry_snapshot: dict[str, tuple[str, str | None, str | None]] = {}
+        self.stale_after = timedelta(days=STALE_AFTER_DAYS)
+        self.stale_device_ids: set[str] = set()
+        self._stale_evaluated = False
+        self._context_listeners: dict[str, dict[Callable[[], None], CALLBACK_TYPE]] = {}
+        self._check_in_index: list[tuple[datetime, str]] = []
+        self._stale_unsub: CALLBACK_TYPE | None = None
+        self._webhook_idle_unsub: CALLBACK_TYPE | None = None
 
     async def _async_update_data(self) -> JamfNowData:
         try:
-            devices = await self.client.async_get_devices()
+            if self._details_loaded:
+                devices = await self.client.async_get_devices()
+                if self._backfill_task is not None:
+                    self._backfill_task.cancel()
+                    self._backfill_task = None
+            else:
+                devices = await self.client.async_get_device_listing()
             blueprints = await self.client.async_get_blueprints()
-            return JamfNowData(devices=devices, blueprints=blueprints)
         except Exception as err:
             raise UpdateFailed(f"Error communicating with Jamf Now: {err}") from err
+        if not self._details_loaded:
+            self._details_loaded = True
+            self._backfill_task = self.hass.async_create_background_task(
+                self._async_backfill_details(devices), name=f"{DOMAIN}_detail_backfill"
+            )
+        return JamfNowData(devices=devices, blueprints=blueprints)
+
+    async def _async_backfill_details(self, devices: list[JamfNowDevice]) -> None:
+        ordered = sorted(devices, key=_backfill_priority)
+        for start in range(0, len(ordered), DETAIL_BACKFILL_BATCH_SIZE):
+            batch = [
+                device
+                for device in ordered[start : start + DETAIL_BACKFILL_BATCH_SIZE]
+                if self.data is None or self.get_device(device.id) is device
+            ]
+            if not batch:
+                continue
+            results = await asyncio.gather(
+                *(self.client.async_get_device(device.id) for device in batch),
+                return_exceptions=True,
+            )
+            updated: list[str] = []
+            for device, detail in zip(batch, results):
+                if isinstance(detail, Exception):
+                    _LOGGER.debug("Detail backfill failed for device %s: %s", device.id, detail)
+                    continue
+                if self.get_device(device.id) is not device:
+                    continue
+                self.client.apply_device_detail(device, detail)
+                updated.append(device.id)
+            if updated:
+                self.async_update_devices_listeners(updated)
+
+    async def async_shutdown(self) -> None:
+        if self._backfill_task is not None:
+            self._backfill_task.cancel()
+            self._backfill_task = None
+        if self._stale_unsub is not None:
+            self._stale_unsub()
+            self._stale_unsub = None
+        if self._webhook_idle_unsub is not None:
+            self._webhook_idle_unsub()
+            self._webhook_idle_unsub = None
+        await super().async_shutdown()
 
     def device_present(self, device_id: str) -> bool:
         if not self.data:
             return False
-        return any(device.id == device_id for device in self.data.devices)
+        return self.data.get_device(device_id) is not None
 
     def get_device(self, device_id: str) -> JamfNowDevice | None:
         if not self.data:
             return None
-        for device in self.data.devices:
-            if device.id == device_id:
-                return device
-        return None
+        return self.data.get_device(device_id)
+
+    def device_info(self, device_id: str) -> DeviceInfo:
+        if device_id not in self._device_infos:
+            device = self.get_device(device_id)
+            self._device_infos[device_id] = DeviceInfo(
+                identifiers={(DOMAIN, device_id)},
+                name=device.name if device else "Jamf Now Device",
+                manufacturer="Apple",
+                model=device.model if device else None,
+                serial_number=device.serial_number if device else None,
+                sw_version=device.os_version if device else None,
+            )
+        return self._device_infos[device_id]
+
+    @callback
+    def _async_sync_device_registry(self, devices: list[JamfNowDevice]) -> None:
+        registry = dr.async_get(self.hass)
+        for device in devices:
+            current = (device.name, device.model, device.os_version)
+            if self._registry_snapshot.get(device.id) == current:
+                continue
+            entry = registry.async_get_device(identifiers={(DOMAIN, device.id)})
+            if entry is None:
+                continue
+            if (entry.name, entry.model, entry.sw_version) != current:
+                registry.async_update_device(
+                    entry.id, name=device.name, model=device.model, sw_version=device.os_version
+                )
+            self._registry_snapshot[device.id] = current
+
+    def devices_stale_since(self, cutoff: datetime) -> list[str]:
+        index = bisect_right(self._check_in_index, cutoff, key=itemgetter(0))
+        return [device_id for _, device_id in self._check_in_index[:index]]
+
+    def stale_device_count(self, now: datetime) -> int:
+        return bisect_right(self._check_in_index, now - self.stale_after, key=itemgetter(0))
+
+    def next_device_to_go_stale(self, now: datetime) -> tuple[str, datetime] | None:
+        index = bisect_right(self._check_in_index, now - self.stale_after, key=itemgetter(0))
+        if index >= len(self._check_in_index):
+            return None
+        checked_in, device_id = self._check_in_index[index]
+        return device_id, checked_in + self.stale_after
+
+    def _update_check_in_index(self, device: JamfNowDevice, previous: datetime | None) -> None:
+        if previous is not None:
+            index = bisect_left(self._check_in_index, (previous, device.id))
+            if index < len(self._check_in_index) and self._check_in_index[index] == (previous, device.id):
+                del self._check_in_index[index]
+        if device.last_check_in_at is not None:
+            insort(self._check_in_index, (device.last_check_in_at, device.id))
+
+    @callback
+    def _async_evaluate_staleness(self) -> bool:
+        now = dt_util.utcnow()
+        stale = set(self.devices_stale_since(now - self.stale_after))
+        if self._stale_evaluated:
+            for device_id in stale - self.stale_device_ids:
+                device = self.get_device(device_id)
+                self.hass.bus.async_fire(
+                    EVENT_DEVICE_STALE,
+                    {
+                        "device_id": device_id,
+                        "name": device.name if device else None,
+                        "last_check_in": device.last_check_in_at.isoformat()
+                        if device and device.last_check_in_at
+                        else None,
+                    },
+                )
+        changed = not self._stale_evaluated or stale != self.stale_device_ids
+        self.stale_device_ids = stale
+        self._stale_evaluated = True
+
+        if self._stale_unsub is not None:
+            self._stale_unsub()
+            self._stale_unsub = None
+        upcoming = self.next_device_to_go_stale(now)
+        if upcoming is not None:
+            self._stale_unsub = async_track_point_in_utc_time(
+                self.hass, self._async_handle_stale_timer, upcoming[1]
+            )
+        return changed
+
+    @callback
+    def _async_handle_stale_timer(self, _now: datetime) -> None:
+        self._stale_unsub = None
+        if self._async_evaluate_staleness():
+            self._async_update_context_listeners(STALE_DEVICES_CONTEXT)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        if self.data:
+            self._check_in_index = sorted(
+                (device.last_check_in_at, device.id) for device in self.data.devices if device.last_check_in_at
+            )
+            self._async_evaluate_staleness()
+            self._async_sync_device_registry(self.data.devices)
+        with self.client.phase("entity updates"):
+            super().async_update_listeners()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE, context: Any = None) -> Callable[[], None]:
+        remove_listener = super().async_add_listener(update_callback, context)
+        if not isinstance(context, str):
+            return remove_listener
+        listeners = self._context_listeners.setdefault(context, {})
+        listeners[remove_listener] = update_callback
+
+        @callback
+        def remove_context_listener() -> None:
+            remove_listener()
+            listeners.pop(remove_listener, None)
+            if not listeners and self._context_listeners.get(context) is listeners:
+                del self._context_listeners[context]
+
+        return remove_context_listener
+
+    @callback
+    def async_update_device_listeners(self, device_id: str) -> None:
+        self.async_update_devices_listeners([device_id])
+
+    @callback
+    def async_update_devices_listeners(self, device_ids: list[str]) -> None:
+        devices = [device for device in map(self.get_device, device_ids) if device is not None]
+        if devices:
+            self._async_sync_device_registry(devices)
+        for device_id in device_ids:
+            self._async_update_context_listeners(device_id)
+
+    @callback
+    def _async_update_context_listeners(self, context: str) -> None:
+        for update_callback in list(self._context_listeners.get(context, {}).values()):
+            update_callback()
+
+    @callback
+    def async_apply_device_event(self, event: str, device_id: str, changes: dict[str, Any]) -> bool:
+        device = self.get_device(device_id)
+        if device is None:
+            _LOGGER.debug("Webhook %s for unknown device %s; requesting refresh", event, device_id)
+            self.hass.async_create_task(self.async_request_refresh())
+            return False
+
+        if self.update_interval != timedelta(seconds=WEBHOOK_RECONCILE_INTERVAL_SECONDS):
+            _LOGGER.debug("Webhook events received; polling reduced to reconciliation interval")
+            self.update_interval = timedelta(seconds=WEBHOOK_RECONCILE_INTERVAL_SECONDS)
+        if self._webhook_idle_unsub is not None:
+            self._webhook_idle_unsub()
+        self._webhook_idle_unsub = async_call_later(self.hass, WEBHOOK_IDLE_SECONDS, self._async_webhook_idle)
+
+        previous_check_in = device.last_check_in_at
+        for key, value in changes.items():
+            setattr(device, key, value)
+        if "last_check_in" in changes:
+            device.last_check_in_at = parse_timestamp(device.last_check_in)
+            self._update_check_in_index(device, previous_check_in)
+            if self._async_evaluate_staleness():
+                self._async_update_context_listeners(STALE_DEVICES_CONTEXT)
+        self.async_update_device_listeners(device_id)
+        return True
+
+    @callback
+    def _async_webhook_idle(self, _now: datetime) -> None:
+        self._webhook_idle_unsub = None
+        _LOGGER.debug("No webhook events for %s seconds; resuming regular polling", WEBHOOK_IDLE_SECONDS)
+        self.update_interval = timedelta(seconds=UPDATE_INTERVAL_SECONDS)
+        self.hass.async_create_task(self.async_request_refresh())
+
+
+def _backfill_priority(device: JamfNowDevice) -> int:
+    if device.lost_mode not in (None, "DISABLED"):
+        return 0
+    if device.supervised is not False:
+        return 1
+    return 2
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import os
+import sys
+import types
+
+if not __package__:
+    # Run as a standalone script: keep this directory off sys.path so the platform
+    # modules (select.py, ...) cannot shadow the standard library, and import the
+    # client through a stand-in package that skips the Home Assistant __init__.
+    _PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:] = [path for path in sys.path if os.path.abspath(path or os.curdir) != _PACKAGE_DIR]
+    _package = types.ModuleType("jamfnow_export")
+    _package.__path__ = [_PACKAGE_DIR]
+    sys.modules["jamfnow_export"] = _package
+    __package__ = "jamfnow_export"
+
+import argparse
+import asyncio
+import csv
+from dataclasses import asdict, fields
+import getpass
+import hashlib
+import json
+from typing import IO, Any, AsyncIterator
+
+import aiohttp
+
+from .api import (
+    JamfNowAiohttpTransport,
+    JamfNowClient,
+    JamfNowDevice,
+    JamfNowError,
+    JamfNowRecordingTransport,
+    JamfNowReplayTransport,
+    JamfNowTransport,
+)
+from .const import DEFAULT_BASE_URL
+
+DEFAULT_EXPORT_CONCURRENCY = 10
+RECORD_FIELDS = [field.name for field in fields(JamfNowDevice)] + ["blueprint_name"]
+
+
+async def async_stream_devices(client: JamfNowClient, concurrency: int) -> AsyncIterator[dict[str, Any]]:
+    devices = await client.async_get_device_listing()
+    blueprint_names = {bp.id: bp.name for bp in await client.async_get_blueprints()}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _with_detail(device: JamfNowDevice) -> JamfNowDevice:
+        async with semaphore:
+            try:
+                detail = await client.async_get_device(device.id)
+            except JamfNowError as err:
+                print(f"Detail fetch failed for device {device.id}: {err}", file=sys.stderr)
+                return device
+        client.apply_device_detail(device, detail)
+        return device
+
+    for next_device in asyncio.as_completed([_with_detail(device) for device in devices]):
+        device = await next_device
+        record = asdict(device)
+        record["blueprint_name"] = blueprint_names.get(device.blueprint_id or "")
+        yield record
+
+
+def _record_hash(record: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(record, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _load_state(path: str | None) -> dict[str, str]:
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as state_file:
+        return json.load(state_file)
+
+
+def _save_state(path: str, state: dict[str, str]) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as state_file:
+        json.dump(state, state_file)
+    os.replace(tmp_path, path)
+
+
+async def async_export(
+    client: JamfNowClient,
+    output: IO[str],
+    output_format: str,
+    concurrency: int,
+    state_path: str | None = None,
+    incremental: bool = False,
+) -> int:
+    previous = _load_state(state_path) if incremental else {}
+    state: dict[str, str] = {}
+    writer: csv.DictWriter[str] | None = None
+    if output_format == "csv":
+        writer = csv.DictWriter(output, fieldnames=RECORD_FIELDS)
+        writer.writeheader()
+
+    await client.async_login()
+    emitted = 0
+    async for record in async_stream_devices(client, concurrency):
+        digest = _record_hash(record)
+        state[record["id"]] = digest
+        if incremental and previous.get(record["id"]) == digest:
+            continue
+        if writer is not None:
+            writer.writerow(record)
+        else:
+            output.write(json.dumps(record, default=str) + "\n")
+        output.flush()
+        emitted += 1
+
+    if state_path:
+        _save_state(state_path, state)
+    return emitted
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Stream the Jamf Now device inventory to NDJSON or CSV.")
+    parser.add_argument("--username", default=os.environ.get("JAMFNOW_USERNAME"))
+    parser.add_argument("--password", default=os.environ.get("JAMFNOW_PASSWORD"))
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    parser.add_argument("--output", help="File to write to (default: stdout)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_EXPORT_CONCURRENCY)
+    parser.add_argument("--state", help="State file recording the devices of the last export")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only emit devices that changed since the export recorded in --state",
+    )
+    parser.add_argument("--record", help="Record API responses to this cassette file")
+    parser.add_argument("--replay", help="Replay API responses from this cassette file instead of the network")
+    args = parser.parse_args(argv)
+    if args.incremental and not args.state:
+        parser.error("--incremental requires --state")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.replay:
+        args.username = args.username or "replay"
+        args.password = args.password or "replay"
+    if not args.username:
+        parser.error("--username or JAMFNOW_USERNAME is required")
+    if args.password is None:
+        args.password = getpass.getpass("Jamf Now password: ")
+    return args
+
+
+async def _async_main(args: argparse.Namespace) -> int:
+    async with aiohttp.ClientSession() as session:
+        transport: JamfNowTransport
+        if args.replay:
+            transport = JamfNowReplayTransport.load(args.replay, speed=0)
+        else:
+            transport = JamfNowAiohttpTransport(session)
+        recorder = JamfNowRecordingTransport(transport) if args.record else None
+        client = JamfNowClient(
+            session=session,
+            base_url=args.base_url,
+            username=args.username,
+            password=args.password,
+            transport=recorder or transport,
+        )
+        output = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+        try:
+            emitted = await async_export(
+                client,
+                output,
+                args.format,
+                args.concurrency,
+                state_path=args.state,
+                incremental=args.incremental,
+            )
+        except JamfNowError as err:
+            print(f"Export failed: {err}", file=sys.stderr)
+            return 1
+        finally:
+            if output is not sys.stdout:
+                output.close()
+            if recorder is not None:
+                recorder.save(args.record)
+    print(f"Exported {emitted} devices", file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    return asyncio.run(_async_main(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
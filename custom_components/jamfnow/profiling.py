@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from datetime import datetime
+import io
+import logging
+import pstats
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .api import JamfNowPhaseRecorder
+from .coordinator import JamfNowDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+TRACEMALLOC_FRAMES = 10
+
+_PROFILE_LOCK = asyncio.Lock()
+
+
+async def async_profile_refreshes(
+    hass: HomeAssistant, coordinators: list[JamfNowDataUpdateCoordinator], top: int
+) -> list[str]:
+    if _PROFILE_LOCK.locked():
+        raise ValueError("A Jamf Now refresh profile is already running")
+    async with _PROFILE_LOCK:
+        return [await async_profile_refresh(hass, coordinator, top) for coordinator in coordinators]
+
+
+async def async_profile_refresh(
+    hass: HomeAssistant, coordinator: JamfNowDataUpdateCoordinator, top: int
+) -> str:
+    recorder = JamfNowPhaseRecorder()
+    profiler = cProfile.Profile()
+    started = dt_util.utcnow()
+    started_tracemalloc = False
+
+    try:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            started_tracemalloc = True
+        coordinator.client.clear_cache()
+        coordinator.client.phase_recorder = recorder
+        profiler.enable()
+        with recorder.phase("refresh"):
+            await coordinator.async_refresh()
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        profiler.disable()
+        coordinator.client.phase_recorder = None
+        if started_tracemalloc:
+            tracemalloc.stop()
+
+    path = hass.config.path(f"jamfnow_profile_{started.strftime('%Y%m%d_%H%M%S')}.txt")
+    await hass.async_add_executor_job(
+        _write_report, path, started, coordinator, profiler, snapshot, recorder, top
+    )
+    _LOGGER.info("Jamf Now refresh profile written to %s", path)
+    return path
+
+
+def _write_report(
+    path: str,
+    started: datetime,
+    coordinator: JamfNowDataUpdateCoordinator,
+    profiler: cProfile.Profile,
+    snapshot: tracemalloc.Snapshot,
+    recorder: JamfNowPhaseRecorder,
+    top: int,
+) -> None:
+    devices = len(coordinator.data.devices) if coordinator.data else 0
+    lines = [
+        f"Jamf Now refresh profile — {started.isoformat()}",
+        f"Refresh succeeded: {coordinator.last_update_success}",
+        f"Devices: {devices}",
+        "",
+        "== Phase timeline (first start / count / total / max, seconds) ==",
+    ]
+    phases: dict[str, list[float]] = {}
+    for name, offset, duration in recorder.phases:
+        summary = phases.setdefault(name, [offset, 0, 0.0, 0.0])
+        summary[0] = min(summary[0], offset)
+        summary[1] += 1
+        summary[2] += duration
+        summary[3] = max(summary[3], duration)
+    for name, (first, count, total, longest) in sorted(phases.items(), key=lambda item: item[1][0]):
+        lines.append(f"{first:10.4f}  {int(count):6d}  {total:10.4f}  {longest:10.4f}  {name}")
+
+    stats_stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stats_stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    lines.extend(["", f"== Top {top} functions by cumulative time ==", stats_stream.getvalue()])
+
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+    )
+    lines.extend(["", f"== Top {top} allocation sites =="])
+    for stat in snapshot.statistics("lineno")[:top]:
+        lines.append(str(stat))
+
+    with open(path, "w", encoding="utf-8") as report:
+        report.write("\n".join(lines) + "\n")
@@ -45,14 +45,7 @@ class JamfNowBlueprintSelect(SelectEntity):
 
     @property
     def device_info(self) -> DeviceInfo:
-        device = self.coordinator.get_device(self._device_id)
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.name if device else "Jamf Now Device",
-            manufacturer="Apple",
-            model=device.model if device else None,
-            serial_number=device.serial_number if device else None,
-        )
+        return self.coordinator.device_info(self._device_id)
 
     @property
     def name(self) -> str | None:
@@ -2,23 +2,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable
-
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from datetime import datetime
+from typing import Any, Callable
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .api import JamfNowDevice
-from .const import DOMAIN
+from .const import DOMAIN, STALE_DEVICES_CONTEXT
 from .coordinator import JamfNowDataUpdateCoordinator
 
 
 @dataclass(frozen=True, kw_only=True)
 class JamfNowSensorDescription(SensorEntityDescription):
 
-    value_fn: Callable[[JamfNowDevice], str | None]
+    value_fn: Callable[[JamfNowDevice], str | datetime | None]
 
 
 SENSOR_DESCRIPTIONS: tuple[JamfNowSensorDescription, ...] = (
@@ -45,7 +52,8 @@ SENSOR_DESCRIPTIONS: tuple[JamfNowSensorDescription, ...] = (
     JamfNowSensorDescription(
         key="last_check_in",
         name="Last Check-in",
-        value_fn=lambda device: device.last_check_in,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda device: device.last_check_in_at,
     ),
     JamfNowSensorDescription(
         key="lost_mode",
@@ -61,7 +69,7 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: JamfNowDataUpdateCoordinator = data["coordinator"]
 
-    entities: list[JamfNowSensor] = []
+    entities: list[SensorEntity] = [JamfNowStaleDevicesSensor(coordinator, entry.entry_id)]
     if coordinator.data:
         for device in coordinator.data.devices:
             for description in SENSOR_DESCRIPTIONS:
@@ -80,25 +88,17 @@ class JamfNowSensor(CoordinatorEntity[JamfNowDataUpdateCoordinator], SensorEntit
         device_id: str,
         description: JamfNowSensorDescription,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=device_id)
         self.entity_description = description
         self._device_id = device_id
         self._attr_unique_id = f"{device_id}_{description.key}"
 
     @property
     def device_info(self) -> DeviceInfo:
-        device = self.coordinator.get_device(self._device_id)
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.name if device else "Jamf Now Device",
-            manufacturer="Apple",
-            model=device.model if device else None,
-            serial_number=device.serial_number if device else None,
-            sw_version=device.os_version if device else None,
-        )
+        return self.coordinator.device_info(self._device_id)
 
     @property
-    def native_value(self) -> str | None:
+    def native_value(self) -> str | datetime | None:
         device = self.coordinator.get_device(self._device_id)
         if not device:
             return None
@@ -108,3 +108,27 @@ class JamfNowSensor(CoordinatorEntity[JamfNowDataUpdateCoordinator], SensorEntit
                 if str(bp.id) == str(value):
                     return bp.name
         return value
+
+
+class JamfNowStaleDevicesSensor(CoordinatorEntity[JamfNowDataUpdateCoordinator], SensorEntity):
+
+    _attr_name = "Jamf Now Stale Devices"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "devices"
+
+    def __init__(self, coordinator: JamfNowDataUpdateCoordinator, entry_id: str) -> None:
+        super().__init__(coordinator, context=STALE_DEVICES_CONTEXT)
+        self._attr_unique_id = f"{entry_id}_stale_devices"
+
+    @property
+    def native_value(self) -> int:
+        return self.coordinator.stale_device_count(dt_util.utcnow())
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        upcoming = self.coordinator.next_device_to_go_stale(dt_util.utcnow())
+        return {
+            "stale_after_days": self.coordinator.stale_after.days,
+            "next_stale_device_id": upcoming[0] if upcoming else None,
+            "next_stale_at": upcoming[1].isoformat() if upcoming else None,
+        }
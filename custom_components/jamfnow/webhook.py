@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+import logging
+from typing import Any
+
+from aiohttp import web
+import voluptuous as vol
+from homeassistant.components import persistent_notification, webhook
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.network import NoURLAvailableError
+
+from .const import (
+    DOMAIN,
+    WEBHOOK_EVENT_BLUEPRINT,
+    WEBHOOK_EVENT_CHECK_IN,
+    WEBHOOK_EVENT_ENROLLMENT,
+    WEBHOOK_EVENT_LOST_MODE,
+)
+from .api import parse_timestamp
+from .coordinator import JamfNowDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _lost_mode(value: Any) -> str:
+    if isinstance(value, bool):
+        return "ENABLED" if value else "DISABLED"
+    if isinstance(value, str) and value:
+        return value
+    raise vol.Invalid("lost_mode must be a non-empty status string or a boolean")
+
+
+def _check_in_time(value: Any) -> str:
+    if isinstance(value, (str, int)) and not isinstance(value, bool) and parse_timestamp(value) is not None:
+        return str(value)
+    raise vol.Invalid("last_check_in must be an ISO 8601 timestamp or epoch seconds/milliseconds")
+
+
+def _identifier(value: Any) -> str:
+    if isinstance(value, (str, int)) and not isinstance(value, bool):
+        return str(value)
+    raise vol.Invalid("expected a string or integer id")
+
+
+_DEVICE_ID = vol.All(_identifier, vol.Length(min=1))
+_OPTIONAL_ID = vol.Any(None, _identifier)
+
+EVENT_FIELDS: dict[str, dict[Any, Any]] = {
+    WEBHOOK_EVENT_CHECK_IN: {
+        vol.Required("last_check_in"): _check_in_time,
+        vol.Optional("os_version"): vol.Any(str, None),
+        vol.Optional("status"): vol.Any(str, None),
+    },
+    WEBHOOK_EVENT_ENROLLMENT: {
+        vol.Optional("name"): str,
+        vol.Optional("serial_number"): str,
+        vol.Optional("model"): vol.Any(str, None),
+        vol.Optional("os_version"): vol.Any(str, None),
+        vol.Optional("status"): vol.Any(str, None),
+        vol.Optional("blueprint_id"): _OPTIONAL_ID,
+        vol.Optional("supervised"): vol.Any(bool, None),
+    },
+    WEBHOOK_EVENT_LOST_MODE: {
+        vol.Required("lost_mode"): _lost_mode,
+    },
+    WEBHOOK_EVENT_BLUEPRINT: {
+        vol.Required("blueprint_id"): _OPTIONAL_ID,
+    },
+}
+
+EVENT_SCHEMAS: dict[str, vol.Schema] = {
+    event: vol.Schema(
+        {
+            vol.Required("event"): event,
+            vol.Required("device_id"): _DEVICE_ID,
+            **fields,
+        }
+    )
+    for event, fields in EVENT_FIELDS.items()
+}
+
+
+def async_register_webhook(
+    hass: HomeAssistant,
+    webhook_id: str,
+    coordinator: JamfNowDataUpdateCoordinator,
+    notify: bool = False,
+) -> None:
+    async def handle_webhook(hass: HomeAssistant, webhook_id: str, request: web.Request) -> web.Response:
+        try:
+            payload = await request.json()
+        except ValueError:
+            return web.Response(status=HTTPStatus.BAD_REQUEST, text="Invalid JSON")
+
+        events = payload if isinstance(payload, list) else [payload]
+        validated: list[dict[str, Any]] = []
+        for item in events:
+            event = item.get("event") if isinstance(item, dict) else None
+            schema = EVENT_SCHEMAS.get(event) if isinstance(event, str) else None
+            if schema is None:
+                return web.Response(status=HTTPStatus.BAD_REQUEST, text="Unknown or missing event type")
+            try:
+                validated.append(schema(item))
+            except vol.Invalid as err:
+                return web.Response(status=HTTPStatus.BAD_REQUEST, text=f"Invalid payload: {err}")
+
+        applied = 0
+        for item in validated:
+            event = item.pop("event")
+            device_id = item.pop("device_id")
+            if coordinator.async_apply_device_event(event, device_id, item):
+                applied += 1
+        return web.json_response({"received": len(validated), "applied": applied})
+
+    webhook.async_register(hass, DOMAIN, "Jamf Now", webhook_id, handle_webhook)
+    try:
+        url = webhook.async_generate_url(hass, webhook_id)
+    except NoURLAvailableError:
+        url = webhook.async_generate_path(webhook_id)
+    _LOGGER.info("Jamf Now webhook available at %s", url)
+    if notify:
+        persistent_notification.async_create(
+            hass,
+            f"Send Jamf Now device events to:\n\n`{url}`\n\nSee the integration README for the payload format.",
+            title="Jamf Now webhook",
+            notification_id=f"{DOMAIN}_webhook_{webhook_id}",
+        )
+
+
+def async_unregister_webhook(hass: HomeAssistant, webhook_id: str) -> None:
+    webhook.async_unregister(hass, webhook_id)